@@ -0,0 +1,26 @@
+from django.db import migrations, models
+
+
+def populate_short_id(apps, schema_editor):
+    User = apps.get_model("accounts", "User")
+    users = list(User.objects.only("id"))
+    for user in users:
+        user.short_id = user.id.hex[:8]
+    User.objects.bulk_update(users, ["short_id"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='short_id',
+            field=models.CharField(default='', editable=False, max_length=8),
+            preserve_default=False,
+        ),
+        migrations.RunPython(populate_short_id, migrations.RunPython.noop),
+    ]
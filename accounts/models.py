@@ -4,11 +4,22 @@ Privacy-focused custom User model.
 The `masked_email` property lets the UI show 'j***n@g***.com' instead of the
 real address, so even in admin / templates personal data is never leaked.
 """
+import functools
+import re
 import uuid
 
 from django.contrib.auth.models import AbstractUser
 from django.db import models
 
+# first/last char of the local part, first char of the domain, last ".ext"
+# (dotless domains such as "localhost" take the bare `.*` branch)
+_EMAIL_RE = re.compile(r"([^@])(?:[^@]*([^@]))?@(.)(?:.*(\.[^.]*)|.*)", re.DOTALL)
+
+
+def format_public_name(display_name: str, short_id: str) -> str:
+    """The alias shown to other users; usable on raw `.values()` rows too."""
+    return display_name or f"user-{short_id}"
+
 
 class User(AbstractUser):
     """Extended user that adds a public alias and masks PII by default."""
@@ -19,29 +30,30 @@ class User(AbstractUser):
         blank=True,
         help_text="Public alias shown instead of your real name.",
     )
+    # First 8 hex chars of the id, stored so public_name needn't format the UUID.
+    short_id = models.CharField(max_length=8, editable=False)
 
     class Meta:
         verbose_name = "user"
         verbose_name_plural = "users"
 
     # ── Privacy helpers ───────────────────────────────────────────────────
-    @property
+    @functools.cached_property
     def masked_email(self) -> str:
         """Return an obfuscated version of the email, e.g. j***n@g***.com"""
-        if not self.email or "@" not in self.email:
+        m = _EMAIL_RE.fullmatch(self.email or "")
+        if m is None:
             return ""
-        local, domain = self.email.split("@", 1)
-        masked_local = local[0] + "***" + (local[-1] if len(local) > 1 else "")
-        if "." in domain:
-            domain_name, domain_ext = domain.rsplit(".", 1)
-            masked_domain = domain_name[0] + "***" + "." + domain_ext
-        else:
-            masked_domain = domain[0] + "***"
-        return f"{masked_local}@{masked_domain}"
+        return f"{m[1]}***{m[2] or ''}@{m[3]}***{m[4] or ''}"
 
     @property
     def public_name(self) -> str:
-        return self.display_name or f"user-{str(self.id)[:8]}"
+        return format_public_name(self.display_name, self.short_id)
+
+    def save(self, *args, **kwargs):
+        if not self.short_id:
+            self.short_id = self.id.hex[:8]
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return self.public_name
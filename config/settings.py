@@ -10,6 +10,12 @@ import dj_database_url
 # ─── Paths ────────────────────────────────────────────────────────────────────
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+
+def _csv_env(name, default=""):
+    """Read a comma-separated env var into a list, dropping blank entries."""
+    return [v for v in os.environ.get(name, default).split(",") if v]
+
+
 SECRET_KEY = os.environ.get(
     "DJANGO_SECRET_KEY",
     "django-insecure-CHANGE-ME-before-production-!@#456",
@@ -17,15 +23,14 @@ SECRET_KEY = os.environ.get(
 
 DEBUG = os.environ.get("DJANGO_DEBUG", "True").lower() in ("true", "1", "yes")
 
-ALLOWED_HOSTS = os.environ.get("DJANGO_ALLOWED_HOSTS", "*").split(",")
+ALLOWED_HOSTS = _csv_env("DJANGO_ALLOWED_HOSTS", "*")
 
 RENDER_EXTERNAL_HOSTNAME = os.environ.get("RENDER_EXTERNAL_HOSTNAME")
 if RENDER_EXTERNAL_HOSTNAME:
     ALLOWED_HOSTS.append(RENDER_EXTERNAL_HOSTNAME)
 
 # Trust Render's proxy headers
-CSRF_TRUSTED_ORIGINS = os.environ.get("CSRF_TRUSTED_ORIGINS", "").split(",")
-CSRF_TRUSTED_ORIGINS = [o for o in CSRF_TRUSTED_ORIGINS if o]  # filter blanks
+CSRF_TRUSTED_ORIGINS = _csv_env("CSRF_TRUSTED_ORIGINS")
 
 # ─── Application Definition ──────────────────────────────────────────────────
 INSTALLED_APPS = [
@@ -86,9 +91,20 @@ _url_has_scheme = (
     and DATABASE_URL.index("://") > 0  # something before ://
 )
 if _url_has_scheme:
+    # psycopg 3's built-in pool keeps warm connections per worker; Django
+    # requires CONN_MAX_AGE = 0 when pooling, the pool handles reuse.
+    # CONN_HEALTH_CHECKS makes the pool check a connection before handing it
+    # out, so one dropped by the server (idle timeout, restart) isn't reused.
     DATABASES = {
-        "default": dj_database_url.parse(DATABASE_URL, conn_max_age=600)
+        "default": dj_database_url.parse(
+            DATABASE_URL, conn_max_age=0, conn_health_checks=True
+        )
     }
+    if DATABASES["default"]["ENGINE"] == "django.db.backends.postgresql":
+        DATABASES["default"].setdefault("OPTIONS", {})["pool"] = {
+            "min_size": 2,
+            "max_size": 10,
+        }
 else:
     DATABASES = {
         "default": {
@@ -126,9 +142,12 @@ STORAGES = {
         "BACKEND": "django.core.files.storage.FileSystemStorage",
     },
     "staticfiles": {
-        "BACKEND": "whitenoise.storage.CompressedStaticFilesStorage",
+        "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
     },
 }
+# Hashing + gzip/brotli happen once in build.sh's collectstatic; the
+# unhashed originals are never referenced, so don't ship them.
+WHITENOISE_KEEP_ONLY_HASHED_FILES = True
 
 MEDIA_URL = "media/"
 MEDIA_ROOT = BASE_DIR / "media"
@@ -139,8 +158,8 @@ CRISPY_TEMPLATE_PACK = "tailwind"
 
 # ─── Network (QR codes use the deployed URL or LAN IP) ──────────────────────
 LAN_HOST = os.environ.get("LAN_HOST", "")
-# RENDER_EXTERNAL_HOSTNAME is already set above for ALLOWED_HOSTS;
-# it's also used by models.Item.generate_qr_code() for QR links.
+# RENDER_EXTERNAL_HOSTNAME is already set above for ALLOWED_HOSTS; items.models
+# reads it (or LAN_HOST) once at import as the base URL for QR links.
 
 # ─── Misc ────────────────────────────────────────────────────────────────────
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
@@ -10,6 +10,8 @@ urlpatterns = [
     path("", include("items.urls")),
 ]
 
-# Serve media files — in production WhiteNoise handles static, but media
-# still needs Django to serve from MEDIA_ROOT (or use a cloud storage backend).
-urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+# Serve media files through Django's serve() view in development only; it
+# streams through Python chunk by chunk. In production put media behind the
+# web server or a cloud storage backend (QR codes are inlined as data URIs).
+if settings.DEBUG:
+    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
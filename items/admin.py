@@ -1,27 +1,65 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 
 from .models import Claim, Item, Message, Notification
 
 
+class OnlyChangeList(ChangeList):
+    """Changelist that only SELECTs the admin's `list_only` columns."""
+
+    def get_queryset(self, request, exclude_parameters=None):
+        qs = super().get_queryset(request, exclude_parameters)
+        return qs.only(*self.model_admin.list_only)
+
+
 class ClaimInline(admin.TabularInline):
     model = Claim
     extra = 0
     readonly_fields = ("id", "seeker", "status", "created_at")
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("seeker", "item")
+
 
 class MessageInline(admin.TabularInline):
     model = Message
     extra = 0
     readonly_fields = ("id", "sender", "body", "created_at")
 
+    def get_queryset(self, request):
+        # The inline builds its own queryset, so trimming happens here rather
+        # than as a messages Prefetch on ClaimAdmin. Keep claim (the FK) in
+        # only() or every row re-queries it.
+        return (
+            super().get_queryset(request)
+            .select_related("sender")
+            .only("id", "body", "created_at", "claim", "sender__display_name", "sender__short_id")
+        )
+
 
 @admin.register(Item)
 class ItemAdmin(admin.ModelAdmin):
-    list_display = ("title", "category", "neighborhood", "status", "created_at")
+    list_display = ("title", "category", "neighborhood", "status", "claim_count", "created_at")
     list_filter = ("status", "category", "city")
     search_fields = ("title", "description", "neighborhood")
     readonly_fields = ("id", "handshake_uuid", "qr_code", "created_at", "updated_at")
     inlines = [ClaimInline]
+    list_only = ("title", "category", "neighborhood", "status", "created_at", "finder__id")
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("finder").with_claim_count()
+
+    def get_changelist(self, request, **kwargs):
+        return OnlyChangeList
+
+    @admin.display(description="Claims", ordering="claim_count")
+    def claim_count(self, obj):
+        return obj.claim_count
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term:
+            return queryset, False
+        return queryset.search(search_term), False
 
 
 @admin.register(Claim)
@@ -30,11 +68,25 @@ class ClaimAdmin(admin.ModelAdmin):
     list_filter = ("status",)
     readonly_fields = ("id", "created_at", "updated_at")
     inlines = [MessageInline]
+    list_select_related = ("item", "seeker")
+    list_only = (
+        "status", "created_at",
+        "item__title", "item__status",
+        "seeker__display_name", "seeker__short_id",
+    )
+
+    def get_queryset(self, request):
+        # The change form's title and breadcrumbs render str(claim) too.
+        return super().get_queryset(request).select_related("item", "seeker")
+
+    def get_changelist(self, request, **kwargs):
+        return OnlyChangeList
 
 
 @admin.register(Message)
 class MessageAdmin(admin.ModelAdmin):
     list_display = ("__str__", "sender", "created_at")
+    list_select_related = ("sender",)
     readonly_fields = ("id", "created_at")
 
 
@@ -0,0 +1,41 @@
+"""
+Render and store QR code files for items that are missing one.
+
+    python manage.py generate_qr_codes          # only items without a file
+    python manage.py generate_qr_codes --all    # every item (e.g. after a host change)
+
+Links use RENDER_EXTERNAL_HOSTNAME / LAN_HOST when configured; otherwise
+there is no request to take the host from, so --base-url is required.
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from items.models import _QR_STATIC_BASE, Item
+
+
+class Command(BaseCommand):
+    help = "Generate missing QR code files for items."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Regenerate every item's QR code, not just the missing ones.",
+        )
+        parser.add_argument(
+            "--base-url",
+            help="Public base URL for the QR links, e.g. https://lostandfound.example.org",
+        )
+
+    def handle(self, *args, **options):
+        base_url = (options["base_url"] or "").rstrip("/")
+        if base_url and not base_url.startswith(("http://", "https://")):
+            raise CommandError("--base-url must start with http:// or https://")
+        if not base_url and not _QR_STATIC_BASE:
+            raise CommandError(
+                "Neither RENDER_EXTERNAL_HOSTNAME nor LAN_HOST is set; "
+                "pass --base-url so the QR links point at the right host."
+            )
+
+        queryset = Item.objects.all() if options["all"] else Item.objects.filter(qr_code="")
+        count = Item.bulk_generate_qr(queryset.defer("search_vector"), base_url=base_url or None)
+        self.stdout.write(self.style.SUCCESS(f"Generated {count} QR code(s)."))
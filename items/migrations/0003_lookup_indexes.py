@@ -0,0 +1,43 @@
+# Generated by Django 5.1.15 on 2026-10-15 21:27
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('items', '0002_notification'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='claim',
+            index=models.Index(fields=['item', 'status'], name='items_claim_item_id_4f8727_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='claim',
+            index=models.Index(fields=['seeker', '-created_at'], name='items_claim_seeker__b31c48_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(fields=['-created_at'], name='items_item_created_3eaa9f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(fields=['status', '-created_at'], name='items_item_status_ad442a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(fields=['category'], name='items_item_categor_db7f55_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(fields=['city'], name='items_item_city_9f2e47_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(fields=['claim', 'created_at'], name='items_messa_claim_i_98dc2d_idx'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.1.15 on 2026-10-15 21:27
+
+import uuid6
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('items', '0003_lookup_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='claim',
+            name='id',
+            field=models.UUIDField(default=uuid6.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='item',
+            name='id',
+            field=models.UUIDField(default=uuid6.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='message',
+            name='id',
+            field=models.UUIDField(default=uuid6.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='notification',
+            name='id',
+            field=models.UUIDField(default=uuid6.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
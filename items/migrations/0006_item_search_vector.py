@@ -0,0 +1,48 @@
+# Generated by Django 5.1.15 on 2026-10-15 21:30
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+# PostgreSQL only: a GIN index over search_vector plus a trigger that keeps it
+# in sync with title / description / neighborhood on every INSERT or UPDATE.
+FORWARD_SQL = [
+    "CREATE INDEX items_item_search_vector_gin ON items_item USING gin (search_vector)",
+    """
+    CREATE TRIGGER items_item_search_vector_update
+    BEFORE INSERT OR UPDATE OF title, description, neighborhood, search_vector
+    ON items_item FOR EACH ROW EXECUTE FUNCTION
+    tsvector_update_trigger(search_vector, 'pg_catalog.english', title, description, neighborhood)
+    """,
+    # Touch every row once so the trigger backfills existing items.
+    "UPDATE items_item SET search_vector = NULL",
+]
+
+BACKWARD_SQL = [
+    "DROP TRIGGER IF EXISTS items_item_search_vector_update ON items_item",
+    "DROP INDEX IF EXISTS items_item_search_vector_gin",
+]
+
+
+def _run_on_postgres(statements):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != "postgresql":
+            return
+        for sql in statements:
+            schema_editor.execute(sql)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('items', '0005_created_at_db_default'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='item',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(_run_on_postgres(FORWARD_SQL), _run_on_postgres(BACKWARD_SQL)),
+    ]
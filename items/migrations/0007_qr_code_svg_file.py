@@ -0,0 +1,18 @@
+# Generated by Django 5.1.15 on 2026-10-15 21:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('items', '0006_item_search_vector'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='item',
+            name='qr_code',
+            field=models.FileField(blank=True, upload_to='qrcodes/'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.15 on 2026-10-15 21:36
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('items', '0007_qr_code_svg_file'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(fields=['status', 'updated_at'], name='items_item_status_5e39b0_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.1.15 on 2026-10-15 21:38
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('items', '0008_item_status_updated_at_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='item',
+            name='items_item_categor_db7f55_idx',
+        ),
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(fields=['finder', '-created_at'], name='items_item_finder__1b1f7e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(fields=['category', 'status'], name='items_item_categor_ae2490_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.1.15 on 2026-10-15 21:55
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('items', '0009_finder_and_category_status_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='message',
+            options={'ordering': ['created_at', 'id']},
+        ),
+        migrations.RemoveIndex(
+            model_name='message',
+            name='items_messa_claim_i_98dc2d_idx',
+        ),
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(fields=['claim', 'created_at', 'id'], name='items_messa_claim_i_b80eec_idx'),
+        ),
+    ]
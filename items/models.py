@@ -5,21 +5,75 @@ Item  – a found object reported by a finder.
 Claim – a seeker's "proof of ownership" request linked to an item's UUID.
 Message – anonymous chat messages scoped to a Claim (no PII exchanged).
 """
-import base64
+import functools
 import io
+import threading
 import uuid
 
-import qrcode
+import pybase64 as base64
+import segno
 from django.conf import settings
-from django.core.files.base import ContentFile
-from django.db import models
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVectorField
+from django.core.files.base import ContentFile, File
+from django.db import connection, connections, models, transaction
+from django.db.models.functions import Now
 from django.urls import reverse
+from uuid6 import uuid7
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Item
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# QR links point at the deployed host or LAN IP when one is configured; only
+# otherwise does the request's own host matter. Resolved once at import.
+if getattr(settings, "RENDER_EXTERNAL_HOSTNAME", None):
+    _QR_STATIC_BASE = f"https://{settings.RENDER_EXTERNAL_HOSTNAME}"
+elif getattr(settings, "LAN_HOST", None):
+    _QR_STATIC_BASE = f"http://{settings.LAN_HOST}"
+else:
+    _QR_STATIC_BASE = None
+
+
+@functools.lru_cache(maxsize=8)
+def _request_base_url(scheme, host):
+    """Base URL for QR links when neither host setting is configured."""
+    return f"{scheme}://{host}"
+
+
+_UUID_PLACEHOLDER = "00000000-0000-0000-0000-000000000000"
+
+
+@functools.cache
+def _handshake_url_template():
+    """
+    Reverse the handshake route once and keep it as a format string.
+
+    Built lazily: the URLconf imports views, which import this module.
+    """
+    url = reverse("items:item_handshake", kwargs={"handshake_uuid": _UUID_PLACEHOLDER})
+    return url.replace(_UUID_PLACEHOLDER, "{}")
+
+
+def _write_qr_svg(link, out):
+    """
+    Write a QR SVG for `link` into the file-like `out`.
+
+    SVG is a single path of text, so there's no rasterising or DEFLATE pass,
+    and browsers scale it crisply to whatever size the template asks for.
+    """
+    # A fixed mask skips scoring all eight candidates, the bulk of encode time.
+    segno.make_qr(link, error="m", mask=0).save(out, kind="svg", scale=10, border=4)
+
+
+@functools.lru_cache(maxsize=512)
+def _qr_svg_bytes_for(link):
+    """Encode `link` as a QR SVG; identical links share one encoding."""
+    buf = io.BytesIO()
+    _write_qr_svg(link, buf)
+    return buf.getvalue()
+
+
 class Category(models.TextChoices):
     ELECTRONICS = "electronics", "Electronics"
     CLOTHING = "clothing", "Clothing"
@@ -37,10 +91,38 @@ class ItemStatus(models.TextChoices):
     RETURNED = "returned", "Returned"
 
 
+class ItemQuerySet(models.QuerySet):
+    def search(self, query, ranked=False):
+        """
+        Match items against a free-text query.
+
+        PostgreSQL uses the trigger-maintained `search_vector` (GIN-indexed);
+        other backends fall back to substring matching. With `ranked=True`,
+        PostgreSQL orders the best matches first (newest first on ties).
+        """
+        if connections[self.db].vendor == "postgresql":
+            search_query = SearchQuery(query, config="english", search_type="websearch")
+            qs = self.filter(search_vector=search_query)
+            if ranked:
+                qs = qs.annotate(rank=SearchRank("search_vector", search_query)).order_by(
+                    "-rank", "-created_at"
+                )
+            return qs
+        return self.filter(
+            models.Q(title__icontains=query)
+            | models.Q(description__icontains=query)
+            | models.Q(neighborhood__icontains=query)
+        )
+
+    def with_claim_count(self):
+        """Annotate `claim_count` in one GROUP BY instead of a COUNT per row."""
+        return self.annotate(claim_count=models.Count("claims"))
+
+
 class Item(models.Model):
     """A found item posted by a user."""
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     finder = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -63,13 +145,26 @@ class Item(models.Model):
     # ── Status & Handshake ────────────────────────────────────────────────
     status = models.CharField(max_length=12, choices=ItemStatus.choices, default=ItemStatus.FOUND)
     handshake_uuid = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
-    qr_code = models.ImageField(upload_to="qrcodes/", blank=True)
+    qr_code = models.FileField(upload_to="qrcodes/", blank=True)
+
+    # Maintained by a PostgreSQL trigger (see migration 0006); NULL elsewhere.
+    search_vector = SearchVectorField(null=True, editable=False)
 
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ItemQuerySet.as_manager()
+
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["-created_at"]),
+            models.Index(fields=["status", "-created_at"]),
+            models.Index(fields=["status", "updated_at"]),
+            models.Index(fields=["finder", "-created_at"]),
+            models.Index(fields=["category", "status"]),
+            models.Index(fields=["city"]),
+        ]
 
     def __str__(self):
         return f"{self.title} ({self.get_status_display()})"
@@ -78,53 +173,119 @@ class Item(models.Model):
         return reverse("items:item_detail", kwargs={"pk": self.pk})
 
     def get_handshake_url(self):
-        return reverse("items:item_handshake", kwargs={"handshake_uuid": self.handshake_uuid})
+        return _handshake_url_template().format(self.handshake_uuid)
 
     # ── QR generation ─────────────────────────────────────────────────────
     def _get_qr_base_url(self, request=None):
         """Resolve the public base URL for QR links."""
-        from django.conf import settings as app_settings
-
-        render_host = getattr(app_settings, "RENDER_EXTERNAL_HOSTNAME", "") or ""
-        lan = getattr(app_settings, "LAN_HOST", "") or ""
-
-        if render_host:
-            return f"https://{render_host}"
-        elif lan:
-            return f"http://{lan}"
-        elif request:
-            return request.build_absolute_uri("/")[:-1]
+        if _QR_STATIC_BASE:
+            return _QR_STATIC_BASE
+        if request:
+            return _request_base_url(request.scheme, request.get_host())
         return "http://localhost:8000"
 
-    def _make_qr_png_bytes(self, request=None):
-        """Return raw PNG bytes for the handshake QR code."""
-        link = f"{self._get_qr_base_url(request)}{self.get_handshake_url()}"
-        qr = qrcode.QRCode(version=1, box_size=10, border=4)
-        qr.add_data(link)
-        qr.make(fit=True)
-        img = qr.make_image(fill_color="black", back_color="white")
-        buf = io.BytesIO()
-        img.save(buf, format="PNG")
-        return buf.getvalue()
+    def _qr_link(self, request=None, base_url=None):
+        return f"{base_url or self._get_qr_base_url(request)}{self.get_handshake_url()}"
+
+    def _make_qr_svg_bytes(self, request=None):
+        """Return raw SVG bytes for the handshake QR code."""
+        return _qr_svg_bytes_for(self._qr_link(request))
 
-    @property
+    @functools.cached_property
     def qr_code_data_uri(self):
         """Return a base64 data-URI for the QR code (no filesystem needed)."""
-        png_bytes = self._make_qr_png_bytes()
-        b64 = base64.b64encode(png_bytes).decode("ascii")
-        return f"data:image/png;base64,{b64}"
+        svg_bytes = self._make_qr_svg_bytes()
+        b64 = base64.b64encode(svg_bytes).decode("ascii")
+        return f"data:image/svg+xml;base64,{b64}"
 
     def generate_qr_code(self, request=None):
-        """Create a QR code PNG and save it to the qr_code ImageField."""
-        png_bytes = self._make_qr_png_bytes(request)
-        filename = f"qr_{self.handshake_uuid}.png"
-        self.qr_code.save(filename, ContentFile(png_bytes), save=False)
+        """Create a QR code SVG and save it to the qr_code FileField."""
+        svg_bytes = self._make_qr_svg_bytes(request)
+        filename = f"qr_{self.handshake_uuid}.svg"
+        self.qr_code.save(filename, ContentFile(svg_bytes), save=False)
+
+    @classmethod
+    def bulk_generate_qr(cls, queryset, request=None, base_url=None):
+        """
+        Re-render and store the QR code for every item in `queryset`.
+
+        Meant for bulk repairs (e.g. after a host change): one buffer is reused
+        across items. `base_url` (e.g. "https://example.org") overrides the
+        host the links would otherwise be built from. Returns the number of
+        items processed.
+        """
+        buf = io.BytesIO()
+        count = 0
+        for item in queryset.iterator():
+            buf.seek(0)
+            buf.truncate()
+            _write_qr_svg(item._qr_link(request, base_url), buf)
+            if item.qr_code:
+                item.qr_code.delete(save=False)
+            # Storage reads straight from the buffer; no getvalue() copy.
+            item.qr_code.save(f"qr_{item.handshake_uuid}.svg", File(buf), save=False)
+            item.save(update_fields=["qr_code"])
+            count += 1
+        return count
+
+    def schedule_qr_code(self, request=None):
+        """
+        Render and store the QR file once the current transaction commits,
+        on a background thread so the request doesn't wait for the encode.
+        """
+        # Resolve the link now: the request is gone by the time the thread runs.
+        args = (self.pk, f"qr_{self.handshake_uuid}.svg", self._qr_link(request))
+        transaction.on_commit(
+            lambda: threading.Thread(target=_store_qr_code, args=args, daemon=True).start()
+        )
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remembered so save() can tell whether this instance changed the QR.
+        instance._loaded_qr_code = instance.__dict__.get("qr_code")
+        return instance
 
     def save(self, *args, **kwargs):
         request = kwargs.pop("request", None)
-        if not self.qr_code:
-            self.generate_qr_code(request=request)
+        adding = self._state.adding
+        deferred = self.get_deferred_fields()
+        if (
+            not adding
+            and not args
+            and kwargs.get("update_fields") is None
+            and "qr_code" not in deferred
+            and self.qr_code.name == getattr(self, "_loaded_qr_code", self.qr_code.name)
+        ):
+            # The QR file is written by a background thread (_store_qr_code)
+            # with update(); a full-row save from an instance loaded before
+            # that would put the stale value back. Leave the column out unless
+            # this instance changed it.
+            kwargs["update_fields"] = [
+                f.attname
+                for f in self._meta.concrete_fields
+                if not f.primary_key and f.name != "qr_code" and f.attname not in deferred
+            ]
         super().save(*args, **kwargs)
+        self._loaded_qr_code = self.qr_code.name if "qr_code" not in deferred else None
+        # Only new items need a QR; edits never touch the handshake UUID.
+        if adding and not self.qr_code:
+            self.schedule_qr_code(request=request)
+
+def _store_qr_code(pk, filename, link):
+    """Background worker for `Item.schedule_qr_code`."""
+    try:
+        if not Item.objects.filter(pk=pk, qr_code="").exists():
+            return
+        field = Item._meta.get_field("qr_code")
+        name = field.storage.save(
+            field.generate_filename(None, filename),
+            ContentFile(_qr_svg_bytes_for(link)),
+        )
+        # update() rather than save(): no full-row write, no save() recursion.
+        Item.objects.filter(pk=pk, qr_code="").update(qr_code=name)
+    finally:
+        connection.close()
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -140,7 +301,7 @@ class ClaimStatus(models.TextChoices):
 class Claim(models.Model):
     """A seeker's proof-of-ownership request against a found item."""
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     item = models.ForeignKey(Item, on_delete=models.CASCADE, related_name="claims")
     seeker = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -153,11 +314,15 @@ class Claim(models.Model):
     )
     status = models.CharField(max_length=10, choices=ClaimStatus.choices, default=ClaimStatus.PENDING)
 
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["item", "status"]),
+            models.Index(fields=["seeker", "-created_at"]),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=["item", "seeker"],
@@ -179,7 +344,7 @@ class Claim(models.Model):
 class Message(models.Model):
     """A single chat message inside a Claim thread — fully anonymous."""
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     claim = models.ForeignKey(Claim, on_delete=models.CASCADE, related_name="messages")
     sender = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -187,13 +352,19 @@ class Message(models.Model):
         related_name="sent_messages",
     )
     body = models.TextField(max_length=1000)
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
 
     class Meta:
-        ordering = ["created_at"]
+        # id breaks created_at ties, so the (created_at, id) keyset in
+        # api_messages never skips a row.
+        ordering = ["created_at", "id"]
+        indexes = [
+            models.Index(fields=["claim", "created_at", "id"]),
+        ]
 
     def __str__(self):
-        return f"Msg {str(self.id)[:8]} in claim {str(self.claim_id)[:8]}"
+        # UUIDv7 leads with a timestamp, so the random tail is what tells rows apart.
+        return f"Msg {self.id.hex[-8:]} in claim {self.claim_id.hex[-8:]}"
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -203,7 +374,7 @@ class Message(models.Model):
 class Notification(models.Model):
     """A lightweight in-app notification for finders."""
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     recipient = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -218,7 +389,7 @@ class Notification(models.Model):
     )
     message = models.CharField(max_length=255)
     is_read = models.BooleanField(default=False)
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
 
     class Meta:
         ordering = ["-created_at"]
@@ -4,13 +4,24 @@ Views for the Items app.
 Privacy guarantee: real emails / names are never exposed in any template
 context. The user's `public_name` and `masked_email` are used everywhere.
 """
+import hashlib
+import uuid
+
 from django.contrib import messages as django_messages
 from django.contrib.auth.decorators import login_required
-from django.db.models import Q
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import transaction
+from django.db.models import Count, Max, Q
 from django.http import Http404, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
+from django.template.loader import render_to_string
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from django.views.decorators.http import require_POST
 
+from accounts.models import format_public_name
+
 from .forms import ClaimForm, ItemForm, MessageForm
 from .models import Claim, ClaimStatus, Item, ItemStatus, Message, Notification
 
@@ -19,23 +30,47 @@ from .models import Claim, ClaimStatus, Item, ItemStatus, Message, Notification
 # Item views
 # ═══════════════════════════════════════════════════════════════════════════════
 
+ITEMS_PER_PAGE = 24
+ITEM_LIST_CACHE_SECONDS = 60
+
+
 def item_list(request):
     """Public listing of all currently-found items."""
-    queryset = Item.objects.filter(status=ItemStatus.FOUND)
-
     # Simple search / filter
     q = request.GET.get("q", "").strip()
     category = request.GET.get("category", "").strip()
-
-    if q:
-        queryset = queryset.filter(
-            Q(title__icontains=q) | Q(description__icontains=q) | Q(neighborhood__icontains=q)
+    page = request.GET.get("page", "")
+
+    # The grid is the same for every visitor, so it's cached per query. Adding,
+    # editing, deleting or claiming a found item moves this version, so a cached
+    # grid never outlives the rows it was rendered from.
+    found = Item.objects.filter(status=ItemStatus.FOUND)
+    version = found.aggregate(latest=Max("updated_at"), total=Count("id"))
+    cache_key = "item_list:" + hashlib.md5(
+        repr((q, category, page, version["latest"], version["total"])).encode(),
+        usedforsecurity=False,
+    ).hexdigest()
+
+    def render_grid():
+        # Only the columns item_card.html renders.
+        queryset = found.only(
+            "id", "title", "description", "status", "neighborhood", "city", "image", "created_at",
         )
-    if category:
-        queryset = queryset.filter(category=category)
+        if q:
+            queryset = queryset.search(q, ranked=True)
+        if category:
+            queryset = queryset.filter(category=category)
+
+        page_obj = Paginator(queryset, ITEMS_PER_PAGE).get_page(page)
+        return render_to_string("organisms/item_grid.html", {
+            "items": page_obj,
+            "page_obj": page_obj,
+            "search_query": q,
+            "selected_category": category,
+        })
 
     return render(request, "items/item_list.html", {
-        "items": queryset,
+        "item_grid": cache.get_or_set(cache_key, render_grid, ITEM_LIST_CACHE_SECONDS),
         "search_query": q,
         "selected_category": category,
     })
@@ -43,15 +78,17 @@ def item_list(request):
 
 def item_detail(request, pk):
     """Detail view for a single item (public)."""
-    item = get_object_or_404(Item, pk=pk)
-    # Regenerate QR if missing (e.g. after IP change)
-    if not item.qr_code:
-        item.save(request=request)
+    # The page renders the QR as an inline data URI, so neither the stored
+    # file nor the search vector is read here. Missing QR files are repaired
+    # with `manage.py generate_qr_codes`, off the request path.
+    item = get_object_or_404(
+        Item.objects.select_related("finder").defer("qr_code", "search_vector"), pk=pk
+    )
 
     # If the viewer is the finder, show all claims so they can review & chat
     claims = None
-    if request.user.is_authenticated and request.user == item.finder:
-        claims = item.claims.select_related("seeker").all()
+    if item.finder_id == request.user.pk:
+        claims = item.claims.select_related("seeker").annotate(msg_count=Count("messages"))
 
     return render(request, "items/item_detail.html", {"item": item, "claims": claims})
 
@@ -108,10 +145,12 @@ def item_handshake(request, handshake_uuid):
     Landing page reached by scanning the QR code.
     Redirects to the claim form so the seeker can submit proof of ownership.
     """
-    item = get_object_or_404(Item, handshake_uuid=handshake_uuid)
-    if item.status != ItemStatus.FOUND:
+    item = Item.objects.filter(handshake_uuid=handshake_uuid).values("pk", "status").first()
+    if item is None:
+        raise Http404
+    if item["status"] != ItemStatus.FOUND:
         django_messages.info(request, "This item has already been claimed or returned.")
-    return redirect("items:claim_create", item_pk=item.pk)
+    return redirect("items:claim_create", item_pk=item["pk"])
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -124,32 +163,37 @@ def claim_create(request, item_pk):
     item = get_object_or_404(Item, pk=item_pk)
 
     # Prevent the finder from claiming their own item
-    if item.finder == request.user:
+    if item.finder_id == request.user.pk:
         django_messages.warning(request, "You cannot claim your own item.")
         return redirect(item.get_absolute_url())
 
-    # One claim per seeker per item
-    existing = Claim.objects.filter(item=item, seeker=request.user).first()
-    if existing:
-        django_messages.info(request, "You have already submitted a claim for this item.")
-        return redirect(existing.get_absolute_url())
-
     if request.method == "POST":
         form = ClaimForm(request.POST)
         if form.is_valid():
-            claim = form.save(commit=False)
-            claim.item = item
-            claim.seeker = request.user
-            claim.save()
+            # One claim per seeker per item: the unique constraint backs this
+            # up, so there's no separate "already claimed?" probe up front.
+            claim, created = Claim.objects.get_or_create(
+                item=item,
+                seeker=request.user,
+                defaults={"proof_of_ownership": form.cleaned_data["proof_of_ownership"]},
+            )
+            if not created:
+                django_messages.info(request, "You have already submitted a claim for this item.")
+                return redirect(claim.get_absolute_url())
             # Notify the finder in real-time
             Notification.objects.create(
-                recipient=item.finder,
+                recipient_id=item.finder_id,
                 claim=claim,
                 message=f"{request.user.public_name} submitted a claim on \"{item.title}\".",
             )
             django_messages.success(request, "Claim submitted! The finder will review it.")
             return redirect(claim.get_absolute_url())
     else:
+        # One claim per seeker per item
+        existing = Claim.objects.filter(item=item, seeker=request.user).first()
+        if existing:
+            django_messages.info(request, "You have already submitted a claim for this item.")
+            return redirect(existing.get_absolute_url())
         form = ClaimForm()
 
     return render(request, "items/claim_create.html", {"form": form, "item": item})
@@ -161,9 +205,9 @@ def claim_detail(request, pk):
     View a claim + its anonymous chat thread.
     Only the finder or the seeker may view.
     """
-    claim = get_object_or_404(Claim, pk=pk)
+    claim = get_object_or_404(Claim.objects.select_related("item__finder", "seeker"), pk=pk)
 
-    if request.user not in (claim.seeker, claim.item.finder):
+    if request.user.pk not in (claim.seeker_id, claim.item.finder_id):
         raise Http404
 
     chat_messages = claim.messages.all()
@@ -190,30 +234,36 @@ def claim_detail(request, pk):
 @require_POST
 def claim_respond(request, pk, action):
     """Finder approves or rejects a claim."""
-    claim = get_object_or_404(Claim, pk=pk)
+    claim = get_object_or_404(Claim.objects.select_related("item"), pk=pk)
 
-    if request.user != claim.item.finder:
+    if claim.item.finder_id != request.user.pk:
         raise Http404
 
+    # Plain UPDATEs of the changed columns; Item.save() would rewrite the
+    # whole row and re-run its QR bookkeeping for a status flip.
+    now = timezone.now()
     if action == "approve":
-        claim.status = ClaimStatus.APPROVED
-        claim.item.status = ItemStatus.CLAIMED
-        claim.item.save()
+        with transaction.atomic():
+            Claim.objects.filter(pk=claim.pk).update(status=ClaimStatus.APPROVED, updated_at=now)
+            Item.objects.filter(pk=claim.item_id).update(status=ItemStatus.CLAIMED, updated_at=now)
         django_messages.success(request, "Claim approved. Coordinate return via chat.")
     elif action == "reject":
-        claim.status = ClaimStatus.REJECTED
+        Claim.objects.filter(pk=claim.pk).update(status=ClaimStatus.REJECTED, updated_at=now)
         django_messages.info(request, "Claim rejected.")
     else:
         raise Http404
 
-    claim.save()
     return redirect(claim.get_absolute_url())
 
 
 @login_required
 def my_items(request):
     """Dashboard showing items the current user has posted."""
-    items = Item.objects.filter(finder=request.user)
+    items = (
+        Item.objects.filter(finder=request.user)
+        .with_claim_count()
+        .only("id", "title", "status", "neighborhood", "city", "image", "created_at")
+    )
     return render(request, "items/my_items.html", {"items": items})
 
 
@@ -228,34 +278,53 @@ def my_claims(request):
 # Chat API (AJAX endpoints for real-time-like messaging)
 # ═══════════════════════════════════════════════════════════════════════════════
 
+MESSAGES_PER_POLL = 200
+
+
 @login_required
 def api_messages(request, pk):
-    """Return messages for a claim as JSON. Supports ?after=<msg_id> for polling."""
-    claim = get_object_or_404(Claim, pk=pk)
-    if request.user not in (claim.seeker, claim.item.finder):
-        return JsonResponse({"error": "forbidden"}, status=403)
+    """
+    Return messages for a claim as JSON.
 
-    qs = claim.messages.select_related("sender").all()
+    Supports ?after_ts=<created_at>&after_id=<id> of the last message seen
+    for polling: a keyset read on the (claim, created_at, id) index, with the
+    id breaking timestamp ties. At most MESSAGES_PER_POLL are returned, so
+    long threads load over consecutive polls.
+    """
+    claim = get_object_or_404(Claim.objects.select_related("item"), pk=pk)
+    if request.user.pk not in (claim.seeker_id, claim.item.finder_id):
+        return JsonResponse({"error": "forbidden"}, status=403)
 
-    # If ?after=<uuid> is provided, only return newer messages
-    after = request.GET.get("after")
-    if after:
-        try:
-            last_msg = Message.objects.get(pk=after)
-            qs = qs.filter(created_at__gt=last_msg.created_at)
-        except Message.DoesNotExist:
-            pass
+    # Plain dicts: no Message/User instances are built per row. Times are
+    # formatted client-side from the ISO timestamp.
+    qs = claim.messages.values(
+        "id", "body", "created_at", "sender_id", "sender__display_name", "sender__short_id",
+    )
 
+    try:
+        after_ts = parse_datetime(request.GET.get("after_ts", ""))
+    except ValueError:
+        after_ts = None
+    try:
+        after_id = uuid.UUID(request.GET.get("after_id", ""))
+    except ValueError:
+        after_id = None
+    if after_ts and after_id:
+        qs = qs.filter(Q(created_at__gt=after_ts) | Q(created_at=after_ts, id__gt=after_id))
+    elif after_ts:
+        qs = qs.filter(created_at__gt=after_ts)
+    qs = qs[:MESSAGES_PER_POLL]
+
+    user_id = request.user.pk
     messages_data = [
         {
-            "id": str(msg.id),
-            "body": msg.body,
-            "sender_name": msg.sender.public_name,
-            "is_mine": msg.sender == request.user,
-            "created_at": msg.created_at.isoformat(),
-            "time_display": f"{msg.created_at.strftime('%I:%M %p')}",
+            "id": str(row["id"]),
+            "body": row["body"],
+            "sender_name": format_public_name(row["sender__display_name"], row["sender__short_id"]),
+            "is_mine": row["sender_id"] == user_id,
+            "created_at": row["created_at"].isoformat(),
         }
-        for msg in qs
+        for row in qs
     ]
     return JsonResponse({"messages": messages_data})
 
@@ -264,14 +333,15 @@ def api_messages(request, pk):
 @require_POST
 def api_send_message(request, pk):
     """Send a message via AJAX and return the new message as JSON."""
-    claim = get_object_or_404(Claim, pk=pk)
-    if request.user not in (claim.seeker, claim.item.finder):
+    claim = get_object_or_404(Claim.objects.select_related("item"), pk=pk)
+    if request.user.pk not in (claim.seeker_id, claim.item.finder_id):
         return JsonResponse({"error": "forbidden"}, status=403)
 
     body = request.POST.get("body", "").strip()
     if not body:
         return JsonResponse({"error": "empty message"}, status=400)
 
+    # A single INSERT ... RETURNING created_at; nothing is re-read afterwards.
     msg = Message.objects.create(
         claim=claim,
         sender=request.user,
@@ -280,10 +350,9 @@ def api_send_message(request, pk):
     return JsonResponse({
         "id": str(msg.id),
         "body": msg.body,
-        "sender_name": msg.sender.public_name,
+        "sender_name": request.user.public_name,
         "is_mine": True,
         "created_at": msg.created_at.isoformat(),
-        "time_display": f"{msg.created_at.strftime('%I:%M %p')}",
     })
 
 